@@ -21,3 +21,8 @@ or package manifests.
 
 from .__version__ import __description__, __license__, __title__, __url__, __version__
 from .client import SnykClient
+
+try:
+    from .async_client import AsyncSnykClient
+except ImportError:  # pragma: no cover - httpx is an optional dependency
+    pass
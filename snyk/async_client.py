@@ -0,0 +1,230 @@
+import logging
+import urllib.parse
+from typing import Any, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from .__version__ import __version__
+from .errors import SnykHTTPError
+from .utils import cleanup_path
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSnykClient(object):
+    """
+    Asynchronous variant of SnykClient built on httpx.AsyncClient.
+
+    All requests share a single HTTP/2-capable connection pool, so many
+    independent calls can be issued concurrently with asyncio.gather without
+    paying a TLS handshake per call:
+
+        >>> async with AsyncSnykClient("<your-snyk-api-token>") as client:
+        ...     pages = await asyncio.gather(
+        ...         *[client.get_rest_pages(path) for path in paths]
+        ...     )
+
+    Requires the optional httpx dependency (install the pysnyk[aio] extra).
+    """
+
+    API_URL = "https://api.snyk.io/v1"
+    REST_API_URL = "https://api.snyk.io/rest"
+    USER_AGENT = "pysnyk/%s" % __version__
+
+    def __init__(
+        self,
+        token: str,
+        url: Optional[str] = None,
+        rest_api_url: Optional[str] = None,
+        user_agent: Optional[str] = USER_AGENT,
+        debug: bool = False,
+        verify: bool = True,
+        version: Optional[str] = None,
+    ):
+        self.api_token = token
+        self.api_url = (url or self.API_URL).rstrip("/")
+        self.rest_api_url = (rest_api_url or self.REST_API_URL).rstrip("/")
+        self.api_headers = {
+            "Authorization": "token %s" % self.api_token,
+            "User-Agent": user_agent or self.USER_AGENT,
+        }
+        self.api_post_headers = {
+            **self.api_headers,
+            "Content-Type": "application/json",
+        }
+        self.version = version
+
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=20),
+            headers=self.api_headers,
+            verify=verify,
+        )
+
+        if debug:
+            logging.basicConfig(level=logging.DEBUG)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json: object = None,
+    ) -> httpx.Response:
+        resp = await self._client.request(
+            method, url, headers=headers, params=params, json=json
+        )
+
+        if resp.status_code >= 500:
+            logger.warning(f"Server error: {resp.text}")
+            raise SnykHTTPError(resp)
+        return resp
+
+    async def post(self, path: str, body: Any, headers: dict = {}) -> httpx.Response:
+        url = f"{self.api_url}/{path}"
+        logger.debug(f"POST: {url}")
+
+        resp = await self.request(
+            "POST",
+            url,
+            json=body,
+            headers=(
+                {**self.api_post_headers, **headers}
+                if headers
+                else self.api_post_headers
+            ),
+        )
+        if resp.is_error:
+            logger.error(resp.text)
+            raise SnykHTTPError(resp)
+
+        return resp
+
+    async def put(self, path: str, body: Any, headers: dict = {}) -> httpx.Response:
+        url = f"{self.api_url}/{path}"
+        logger.debug(f"PUT: {url}")
+
+        resp = await self.request(
+            "PUT",
+            url,
+            json=body,
+            headers=(
+                {**self.api_post_headers, **headers}
+                if headers
+                else self.api_post_headers
+            ),
+        )
+        if resp.is_error:
+            logger.error(resp.text)
+            raise SnykHTTPError(resp)
+
+        return resp
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        version: Optional[str] = None,
+        exclude_version: bool = False,
+        exclude_params: bool = False,
+    ) -> httpx.Response:
+        """
+        Mirrors SnykClient.get: the presence of a version, either set on the
+        client or passed to this method, means we're talking to a rest API
+        endpoint and the params are encoded accordingly.
+        """
+
+        path = cleanup_path(path)
+        if version:
+            if exclude_version:
+                url = f"{self.rest_api_url}/{path}"
+            else:
+                url = f"{self.rest_api_url}/{path}?version={version}"
+        else:
+            url = f"{self.api_url}/{path}"
+
+        if (params or self.version) and not exclude_params:
+
+            params = dict(params) if params else {}
+
+            if "version" not in params.keys() and self.version and not exclude_version:
+                params["version"] = version or self.version
+
+            params = {
+                k: str(v).lower() if isinstance(v, bool) else v
+                for k, v in params.items()
+            }
+
+            if "limit" in parse_qs(urlparse(path).query):
+                params.pop("limit", None)
+
+            debug_url = f"{url}&{urllib.parse.urlencode(params)}"
+        else:
+            debug_url = url
+            params = None
+
+        logger.debug(f"GET: {debug_url}")
+
+        resp = await self.request("GET", url, headers=self.api_headers, params=params)
+        if resp.is_error:
+            logger.error(resp.text)
+            raise SnykHTTPError(resp)
+
+        return resp
+
+    async def delete(self, path: str) -> httpx.Response:
+        url = f"{self.api_url}/{path}"
+        logger.debug(f"DELETE: {url}")
+
+        resp = await self.request("DELETE", url, headers=self.api_headers)
+        if resp.is_error:
+            logger.error(resp.text)
+            raise SnykHTTPError(resp)
+
+        return resp
+
+    async def get_rest_pages(self, path: str, params: Optional[dict] = None) -> List:
+        """
+        Async equivalent of SnykClient.get_rest_pages: collects the "data"
+        lists of a paginated rest API response into a single list by following
+        any next links.
+        """
+        first_page_response = await self.get(path, params)
+        page_data = first_page_response.json()
+        return_data = page_data["data"]
+
+        while True:
+            links = page_data.get("links", {})
+            next_url = links.get("next")
+
+            if not next_url or next_url == links.get("self"):
+                break
+
+            logger.debug(f"GET_REST_PAGES: Another link exists: {next_url}")
+
+            next_page_response = await self.get(
+                next_url, {}, exclude_version=True, exclude_params=True
+            )
+            page_data = next_page_response.json()
+
+            current_data = page_data.get("data", [])
+            if not current_data:
+                break
+
+            return_data.extend(current_data)
+            logger.debug(
+                f"GET_REST_PAGES: Added another {len(current_data)} items to the response"
+            )
+
+        return return_data
@@ -1,16 +1,19 @@
 import logging
+import time
 import urllib.parse
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 import requests
-from retry.api import retry_call
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .__version__ import __version__
 from .errors import SnykHTTPError, SnykNotImplementedError
 from .managers import Manager
 from .models import Organization, Project
-from .utils import cleanup_path
+from .utils import cleanup_path, intern_keys, parse_response_json
 
 logger = logging.getLogger(__name__)
 
@@ -32,100 +35,174 @@ class SnykClient(object):
         backoff: int = 2,
         verify: bool = True,
         version: Optional[str] = None,
+        cache_ttl: float = 0,
     ):
         self.api_token = token
         self.api_url = url or self.API_URL
         self.rest_api_url = rest_api_url or self.REST_API_URL
         self.api_headers = {
             "Authorization": "token %s" % self.api_token,
-            "User-Agent": user_agent,
+            "User-Agent": user_agent or self.USER_AGENT,
+            # Ask for compressed responses; requests decodes them transparently
+            # and large JSON listings shrink dramatically on the wire
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+        # A copy, not an alias, so the Content-Type doesn't leak into GETs
+        self.api_post_headers = {
+            **self.api_headers,
+            "Content-Type": "application/json",
         }
-        self.api_post_headers = self.api_headers
-        self.api_post_headers["Content-Type"] = "application/json"
         self.tries = tries
         self.backoff = backoff
         self.delay = delay
         self.verify = verify
         self.version = version
 
+        # Responses for idempotent GETs can be reused for cache_ttl seconds,
+        # saving repeated round-trips for the same path. Disabled by default,
+        # and any write through the client invalidates the cache
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[Tuple, Tuple[float, requests.Response]] = {}
+
+        # A single pooled session means repeated calls to the same host reuse
+        # the underlying TCP+TLS connection rather than re-negotiating per call
+        self._session = requests.Session()
+        self._session.headers.update(self.api_headers)
+
+        # Retrying inside urllib3 keeps each attempt on the pooled connection
+        # and honours any Retry-After header the API sends when rate limiting.
+        # tries is the total number of attempts, as it was with retry_call
+        retries = Retry(
+            total=self.tries - 1,
+            backoff_factor=self.delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Used to fetch paginated responses and fetch_many calls concurrently
+        self._executor = ThreadPoolExecutor(max_workers=10)
+
         # Ensure we don't have a trailing /
         if self.api_url[-1] == "/":
             self.api_url = self.api_url.rstrip("/")
         if self.rest_api_url[-1] == "/":
             self.rest_api_url = self.rest_api_url.rstrip("/")
 
+        # Prefixes used to build request urls on the hot path
+        self._v1_prefix = self.api_url + "/"
+        self._rest_prefix = self.rest_api_url + "/"
+
         if debug:
             logging.basicConfig(level=logging.DEBUG)
 
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Drop cached GET responses whose url contains the given prefix, or the
+        whole cache when no prefix is given.
+
+        Writes through the client call this automatically; scripts that mutate
+        the API out-of-band can call it directly, e.g.
+        client.invalidate("org/%s" % org.id)
+        """
+        if not prefix:
+            self._get_cache.clear()
+            return
+        stale = [key for key in self._get_cache if prefix in key[0]]
+        for key in stale:
+            del self._get_cache[key]
+
+    @staticmethod
+    def _invalidation_scope(path: str) -> str:
+        """
+        Reduce a write path to the org (or org/project) subtree it may have
+        changed, so sibling endpoints under the same scope are also dropped
+        from the cache, e.g. a POST to org/X/project/Y/issue/Z/jira-issue
+        invalidates the cached org/X/project/Y/jira-issues listing
+        """
+        parts = path.strip("/").split("/")
+        if parts[0] != "org" or len(parts) < 2:
+            return ""
+        if len(parts) >= 4 and parts[2] == "project":
+            return "/".join(parts[:4])
+        return "/".join(parts[:2])
+
+    def close(self):
+        """
+        Release the underlying connection pool
+        """
+        self._executor.shutdown()
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def request(
         self,
-        method,
+        method: str,
         url: str,
-        headers: object,
-        params: object = None,
-        json: object = None,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
     ) -> requests.Response:
 
-        if params and json:
-            resp = method(
-                url, headers=headers, params=params, json=json, verify=self.verify
-            )
-        elif params and not json:
-            resp = method(url, headers=headers, params=params, verify=self.verify)
-        elif json and not params:
-            resp = method(url, headers=headers, json=json, verify=self.verify)
-        else:
-            resp = method(url, headers=headers, verify=self.verify)
+        resp = self._session.request(
+            method, url, headers=headers, params=params, json=json, verify=self.verify
+        )
 
-        if not resp or resp.status_code >= requests.codes.server_error:
-            logger.warning(f"Retrying: {resp.text}")
+        if not resp or not resp.ok:
+            logger.error(resp.text)
             raise SnykHTTPError(resp)
         return resp
 
     def post(self, path: str, body: Any, headers: dict = {}) -> requests.Response:
-        url = f"{self.api_url}/{path}"
+        url = self._v1_prefix + path
         logger.debug(f"POST: {url}")
-
-        resp = retry_call(
-            self.request,
-            fargs=[requests.post, url],
-            fkwargs={"json": body, "headers": {**self.api_post_headers, **headers}},
-            tries=self.tries,
-            delay=self.delay,
-            backoff=self.backoff,
-            exceptions=SnykHTTPError,
-            logger=logger,
+        # A write may change anything in this path's scope, so drop cached reads
+        self.invalidate(self._invalidation_scope(path))
+
+        resp = self.request(
+            "POST",
+            url,
+            json=body,
+            # Only pay for a merged dict when the caller passed extra headers
+            headers=(
+                {**self.api_post_headers, **headers}
+                if headers
+                else self.api_post_headers
+            ),
         )
 
-        if not resp.ok:
-            logger.error(resp.text)
-            raise SnykHTTPError(resp)
-
         return resp
 
     def put(self, path: str, body: Any, headers: dict = {}) -> requests.Response:
-        url = "%s/%s" % (self.api_url, path)
+        url = self._v1_prefix + path
         logger.debug("PUT: %s" % url)
-
-        resp = retry_call(
-            self.request,
-            fargs=[requests.put, url],
-            fkwargs={"json": body, "headers": {**self.api_post_headers, **headers}},
-            tries=self.tries,
-            delay=self.delay,
-            backoff=self.backoff,
-            logger=logger,
+        self.invalidate(self._invalidation_scope(path))
+
+        resp = self.request(
+            "PUT",
+            url,
+            json=body,
+            headers=(
+                {**self.api_post_headers, **headers}
+                if headers
+                else self.api_post_headers
+            ),
         )
-        if not resp.ok:
-            logger.error(resp.text)
-            raise SnykHTTPError(resp)
-
         return resp
 
     def get(
         self,
         path: str,
-        params: dict = None,
+        params: Optional[dict] = None,
         version: str = None,
         exclude_version: bool = False,
         exclude_params: bool = False,
@@ -141,21 +218,26 @@ class SnykClient(object):
         Returns a standard requests Response object
         """
 
-        path = cleanup_path(path)
-        if version:
+        # Fully formed urls (e.g. a paginated next link) are used as-is, which
+        # also keeps self-hosted/custom-domain bases working. startswith is a
+        # cheap C-level prefix check rather than a substring scan
+        if path.startswith(("http://", "https://")):
+            url = path
+        elif version:
+            path = cleanup_path(path)
             # When calling a "next page" link, it fails if a version parameter is appended on to the URL - this is a
             # workaround to prevent that from happening...
             if exclude_version:
-                url = f"{self.rest_api_url}/{path}"
+                url = self._rest_prefix + path
             else:
-                url = f"{self.rest_api_url}/{path}?version={version}"
+                url = f"{self._rest_prefix}{path}?version={version}"
         else:
-            url = f"{self.api_url}/{path}"
+            url = self._v1_prefix + cleanup_path(path)
 
         if (params or self.version) and not exclude_params:
 
-            if not params:
-                params = {}
+            # Copy so we never mutate the caller's dict
+            params = dict(params) if params else {}
 
             # we use the presence of version to determine if we are REST or not
             if "version" not in params.keys() and self.version and not exclude_version:
@@ -163,10 +245,10 @@ class SnykClient(object):
 
             # Python Bools are True/False, JS Bools are true/false
             # Snyk REST API is strictly case sensitive at the moment
-
-            for k, v in params.items():
-                if isinstance(v, bool):
-                    params[k] = str(v).lower()
+            params = {
+                k: str(v).lower() if isinstance(v, bool) else v
+                for k, v in params.items()
+            }
 
             # the limit is returned in the url, and if two limits are passed
             # the API interprets as an array and throws an error
@@ -181,92 +263,102 @@ class SnykClient(object):
 
         logger.debug(f"GET: {debug_url}")
 
-        resp = retry_call(
-            self.request,
-            fargs=[requests.get, url],
-            fkwargs=fkwargs,
-            tries=self.tries,
-            delay=self.delay,
-            backoff=self.backoff,
-            logger=logger,
-        )
-        if not resp.ok:
-            logger.error(resp.text)
-            raise SnykHTTPError(resp)
+        if self.cache_ttl:
+            cache_key = (url, frozenset(fkwargs.get("params", {}).items()))
+            cached = self._get_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                logger.debug(f"GET: {debug_url} served from cache")
+                return cached[1]
+
+        resp = self.request("GET", url, **fkwargs)
+        if self.cache_ttl:
+            self._get_cache[cache_key] = (time.monotonic(), resp)
 
         return resp
 
     def delete(self, path: str) -> requests.Response:
-        url = f"{self.api_url}/{path}"
+        url = self._v1_prefix + path
         logger.debug(f"DELETE: {url}")
+        self.invalidate(self._invalidation_scope(path))
 
-        resp = retry_call(
-            self.request,
-            fargs=[requests.delete, url],
-            fkwargs={"headers": self.api_headers},
-            tries=self.tries,
-            delay=self.delay,
-            backoff=self.backoff,
-            logger=logger,
-        )
-        if not resp.ok:
-            logger.error(resp.text)
-            raise SnykHTTPError(resp)
-
+        resp = self.request("DELETE", url, headers=self.api_headers)
         return resp
 
-    def get_rest_pages(self, path: str, params: dict = {}) -> List:
+    def fetch_many(self, paths: List[str], params: Optional[dict] = None) -> List[dict]:
         """
-        Helper function to collect paginated responses from the rest API into a single
-        list.
+        GET several paths concurrently on the pooled session and return their
+        parsed JSON bodies in the same order as the given paths.
 
-        This collects the "data" list from the first response and then appends the
-        any further "data" lists if a next link is found in the links field.
+        Useful for fan-out patterns like fetching the projects of many
+        organizations, where issuing the calls sequentially would pay the
+        full round-trip latency per path.
+        """
+        return list(
+            self._executor.map(
+                lambda path: parse_response_json(self.get(path, params)), paths
+            )
+        )
+
+    def get_rest_pages_iter(self, path: str, params: Optional[dict] = None) -> Iterator:
+        """
+        Generator over all items of a paginated rest API response.
+
+        This yields the contents of each page's "data" list as it arrives, so
+        consumers never hold more than one page in memory at a time — use this
+        over get_rest_pages for very large listings.
+
+        Pagination follows the opaque cursor in the "next" link as-is, which the
+        API can serve in constant time per page. Callers should control page size
+        with a "limit" param rather than passing offset-style page numbers, as
+        offsets get slower the deeper the listing goes.
+
+        As soon as a next link is known the next page is requested on a background
+        thread, so its network round-trip overlaps with processing the current page.
         """
         first_page_response = self.get(path, params)
-        page_data = first_page_response.json()
-        return_data = page_data["data"]
+        page_data = parse_response_json(first_page_response)
+        current_data = page_data["data"]
 
-        while page_data.get("links", {}).get("next"):
-            logger.debug(
-                f"GET_REST_PAGES: Another link exists: {page_data['links']['next']}"
-            )
+        while True:
+            links = page_data.get("links", {})
+            next_url = links.get("next")
 
-            # Process links to get the next url
-            if "next" in page_data["links"]:
-                # If the next url is the same as the current url, break out of the loop
-                if (
-                    "self" in page_data["links"]
-                    and page_data["links"]["next"] == page_data["links"]["self"]
-                ):
-                    break
-                else:
-                    next_url = page_data.get("links", {}).get("next")
-            else:
-                # If there is no next url, break out of the loop
+            # If there is no next url, or the next url is the same as the
+            # current url, break out of the loop
+            if not next_url or next_url == links.get("self"):
                 break
 
-            # The next url comes back fully formed (i.e. with all the params already set, so no need to do it here)
-            next_page_response = self.get(
-                next_url, {}, exclude_version=True, exclude_params=True
+            logger.debug(f"GET_REST_PAGES: Another link exists: {next_url}")
+
+            # The next url comes back fully formed (i.e. with all the params already
+            # set, so no need to do it here). Fetch it in the background while the
+            # current page's data is consumed
+            next_page_future = self._executor.submit(
+                self.get, next_url, {}, exclude_version=True, exclude_params=True
             )
-            page_data = next_page_response.json()
-
-            # Verify that response contains data
-            if "data" in page_data:
-                # If the data is empty, break out of the loop
-                if len(page_data["data"]) == 0:
-                    break
-            # If response does not contain data, break out of the loop
-            else:
+            yield from map(intern_keys, current_data)
+            page_data = parse_response_json(next_page_future.result())
+
+            # If the response contains no data, break out of the loop
+            current_data = page_data.get("data", [])
+            if not current_data:
                 break
 
-            # Append the data from the next page to the return data
-            return_data.extend(page_data["data"])
             logger.debug(
-                f"GET_REST_PAGES: Added another {len(page_data['data'])} items to the response"
+                f"GET_REST_PAGES: Added another {len(current_data)} items to the response"
             )
-        return return_data
+
+        yield from map(intern_keys, current_data)
+
+    def get_rest_pages(self, path: str, params: Optional[dict] = None) -> List:
+        """
+        Helper function to collect paginated responses from the rest API into a single
+        list.
+
+        This collects the "data" list from the first response and then appends the
+        any further "data" lists if a next link is found in the links field.
+        """
+        return list(self.get_rest_pages_iter(path, params))
 
     # alias for backwards compatibility where V3 was the old name
     get_v3_pages = get_rest_pages
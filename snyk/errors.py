@@ -1,14 +1,18 @@
 import json
+from typing import TYPE_CHECKING, Union
 
 import requests
 
+if TYPE_CHECKING:  # pragma: no cover - httpx is an optional dependency
+    import httpx
+
 
 class SnykError(Exception):
     pass
 
 
 class SnykHTTPError(SnykError):
-    def __init__(self, resp: requests.Response):
+    def __init__(self, resp: Union[requests.Response, "httpx.Response"]):
         if hasattr(resp, "json"):
             try:
                 data = resp.json()
@@ -1,82 +1,133 @@
 import abc
 import json
-from typing import Any, Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from deprecation import deprecated  # type: ignore
 
 from .errors import SnykError, SnykNotFoundError, SnykNotImplementedError
-from .utils import snake_to_camel
+from .utils import parse_response_json, snake_to_camel
+
+# Upper bound on concurrent cross-org requests, kept modest so fan-outs don't
+# run into the API's rate limit
+MAX_CROSS_ORG_WORKERS = 8
+
+# Bound once at import for the per-project hot path: calling the unbound
+# dict.get skips the attribute lookup a.get(...) performs on every call
+_DGET = dict.get
+
+_SEVERITIES = ("low", "medium", "high", "critical")
 
 
 class Manager(abc.ABC):
+    # Slots instead of a per-instance __dict__: managers are created for every
+    # collection access, and slot attribute loads take the C fast-path
+    __slots__ = ("klass", "client", "instance", "_all_cache", "_base_path")
+
+    # Seconds that get/first/filter may reuse a previously fetched collection
+    # on this manager instance before calling all() again
+    all_ttl = 30.0
+
     def __init__(self, klass, client, instance=None):
         self.klass = klass
         self.client = client
         self.instance = instance
+        self._all_cache: Optional[Tuple[float, Any]] = None
+        self._base_path: Optional[str] = None
 
     @abc.abstractmethod
     def all(self):
         pass  # pragma: no cover
 
+    def _cached_all(self):
+        """
+        all(), but reused across the lookups this instance serves within
+        all_ttl, so a get() followed by a filter() doesn't re-fetch the whole
+        collection. Direct all() calls always fetch fresh data
+        """
+        if self._all_cache:
+            fetched_at, data = self._all_cache
+            if time.monotonic() - fetched_at < self.all_ttl:
+                return data
+        data = self.all()
+        self._all_cache = (time.monotonic(), data)
+        return data
+
+    def _project_base_path(self) -> str:
+        """
+        The "org/<org_id>/project/<project_id>" prefix shared by project-scoped
+        managers. Delegates to the project's cached _api_base so the prefix
+        survives manager instances, which are recreated on every collection
+        access
+        """
+        if self._base_path is None:
+            self._base_path = self.instance._api_base
+        return self._base_path
+
+    def iterate(self):
+        """
+        Lazy counterpart to all(). The base implementation simply iterates the
+        materialized list, but managers backed by paginated endpoints can
+        override this with a generator so consumers that stop early (get,
+        first) never build objects for records they don't look at.
+        """
+        return iter(self._cached_all())
+
     def get(self, id: str):
+        """
+        Last-resort fallback that fetches the whole collection and scans it.
+        Subclasses whose endpoint supports fetching a single record by id
+        should override this with a direct request, as ProjectManager does.
+        """
         try:
-            return next(x for x in self.all() if x.id == id)
+            return next(x for x in self.iterate() if x.id == id)
         except StopIteration:
             raise SnykNotFoundError
 
     def first(self):
         try:
-            return self.all()[0]
-        except IndexError:
+            return next(self.iterate())
+        except StopIteration:
             raise SnykNotFoundError
 
     def _filter_by_kwargs(self, data, **kwargs: Any):
-        if kwargs:
-            for key, value in kwargs.items():
-                data = [x for x in data if getattr(x, key) == value]
-        return data
+        if not kwargs:
+            return data
+        keys = tuple(kwargs)
+        # attrgetter evaluates every predicate in one C-level call per item,
+        # instead of one pass (and one intermediate list) per kwarg. It
+        # returns a single value for one key and a tuple otherwise
+        getter = attrgetter(*keys)
+        expected = kwargs[keys[0]] if len(keys) == 1 else tuple(kwargs.values())
+        return [x for x in data if getter(x) == expected]
 
     def filter(self, **kwargs: Any):
-        return self._filter_by_kwargs(self.all(), **kwargs)
+        return self._filter_by_kwargs(self._cached_all(), **kwargs)
 
     @staticmethod
     def factory(klass, client, instance=None):
         try:
             if isinstance(klass, str):
-                key = klass
-            else:
-                key = klass.__name__
-            manager = {
-                "Project": ProjectManager,
-                "Organization": OrganizationManager,
-                "Member": MemberManager,
-                "License": LicenseManager,
-                "Dependency": DependencyManager,
-                "Entitlement": EntitlementManager,
-                "Setting": SettingManager,
-                "Ignore": IgnoreManager,
-                "JiraIssue": JiraIssueManager,
-                "DependencyGraph": DependencyGraphManager,
-                "IssueSet": IssueSetManager,
-                "IssueSetAggregated": IssueSetAggregatedManager,
-                "Integration": IntegrationManager,
-                "IntegrationSetting": IntegrationSettingManager,
-                "Tag": TagManager,
-                "IssuePaths": IssuePathsManager,
-            }[key]
-            return manager(klass, client, instance)
-        except KeyError:
+                return _MANAGER_REGISTRY[klass](klass, client, instance)
+            # Model classes carry their manager directly (bound in models.py),
+            # so dispatch is a single attribute read
+            return klass._manager_cls(klass, client, instance)
+        except (KeyError, AttributeError):
             raise SnykError
 
 
 class DictManager(Manager):
+    __slots__ = ()
+
     @abc.abstractmethod
     def all(self) -> Dict[str, Any]:
         pass  # pragma: no cover
 
     def get(self, id: str):
         try:
-            return self.all()[id]
+            return self._cached_all()[id]
         except KeyError:
             raise SnykNotFoundError
 
@@ -85,12 +136,14 @@ class DictManager(Manager):
 
     def first(self):
         try:
-            return next(iter(self.all().items()))
+            return next(iter(self._cached_all().items()))
         except StopIteration:
             raise SnykNotFoundError
 
 
 class SingletonManager(Manager):
+    __slots__ = ()
+
     @abc.abstractmethod
     def all(self) -> Any:
         pass  # pragma: no cover
@@ -106,167 +159,243 @@ class SingletonManager(Manager):
 
 
 class OrganizationManager(Manager):
+    __slots__ = ()
+
     def all(self):
         resp = self.client.get("orgs")
+        # Parse the body once; every .json()-style call re-parses from scratch
+        body = parse_response_json(resp)
         orgs = []
-        if "orgs" in resp.json():
-            for org_data in resp.json()["orgs"]:
-                orgs.append(self.klass.from_dict(org_data))
-        for org in orgs:
-            org.client = self.client
+        client = self.client
+        # Build and bind in one pass rather than re-walking the list
+        for org_data in body.get("orgs", []):
+            org = self.klass.from_dict(org_data)
+            org.client = client
+            orgs.append(org)
         return orgs
 
 
 class TagManager(Manager):
+    __slots__ = ()
+
     def all(self):
         return self.instance._tags
 
     def add(self, key, value) -> bool:
         tag = {"key": key, "value": value}
-        path = "org/%s/project/%s/tags" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
-        return bool(self.client.post(path, tag))
+        path = self._project_base_path() + "/tags"
+        self._all_cache = None
+        # Fire-and-forget write: the status code is all we need, the body is
+        # never parsed
+        resp = self.client.post(path, tag)
+        return 200 <= resp.status_code < 300
 
     def delete(self, key, value) -> bool:
         tag = {"key": key, "value": value}
-        path = "org/%s/project/%s/tags/remove" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
-        return bool(self.client.post(path, tag))
+        path = self._project_base_path() + "/tags/remove"
+        self._all_cache = None
+        resp = self.client.post(path, tag)
+        return 200 <= resp.status_code < 300
+
+    def add_many(self, tags: List[Tuple[str, str]]) -> bool:
+        """
+        Add several (key, value) tags with concurrent requests, amortizing
+        the per-call round-trip latency. The API has no batch tag endpoint,
+        so this issues one POST per tag on the client's pooled session
+        """
+        return self._post_many(self._project_base_path() + "/tags", tags)
+
+    def delete_many(self, tags: List[Tuple[str, str]]) -> bool:
+        """
+        Delete several (key, value) tags with concurrent requests
+        """
+        return self._post_many(self._project_base_path() + "/tags/remove", tags)
+
+    def _post_many(self, path: str, tags: List[Tuple[str, str]]) -> bool:
+        if not tags:
+            return True
+        self._all_cache = None
+        workers = min(MAX_CROSS_ORG_WORKERS, len(tags))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return all(
+                executor.map(
+                    lambda tag: 200
+                    <= self.client.post(
+                        path, {"key": tag[0], "value": tag[1]}
+                    ).status_code
+                    < 300,
+                    tags,
+                )
+            )
 
 
 class ProjectManager(Manager):
+    __slots__ = ()
+
     def _rest_to_v1_response_format(self, project):
-        attributes = project.get("attributes", {})
-        settings = attributes.get("settings", {})
-        recurring_tests = settings.get("recurring_tests", {})
-        issue_counts = project.get("meta", {}).get("latest_issue_counts", {})
-        remote_repo_url = (
-            project.get("relationships", {})
-            .get("target", {})
-            .get("data", {})
-            .get("attributes", {})
-            .get("url")
-        )
-        image_cluster = (
-            project.get("relationships", {})
-            .get("target", {})
-            .get("data", {})
-            .get("meta", {})
-            .get("integration_data", {})
-            .get("cluster")
-        )
+        # Walk each shared subtree exactly once; chaining .get(..., {}) per
+        # field re-traverses the document and allocates a throwaway dict at
+        # every level, which adds up when called once per project per page
+        attributes = project.get("attributes") or {}
+        settings = attributes.get("settings") or {}
+        recurring_tests = settings.get("recurring_tests") or {}
+        issue_counts = (project.get("meta") or {}).get("latest_issue_counts") or {}
+        relationships = project.get("relationships") or {}
+        target_data = (relationships.get("target") or {}).get("data") or {}
+        target_attributes = target_data.get("attributes") or {}
+        target_meta = target_data.get("meta") or {}
+        importer = (relationships.get("importer") or {}).get("data") or {}
+        owner = (relationships.get("owner") or {}).get("data") or {}
+        remote_repo_url = target_attributes.get("url")
+        image_cluster = (target_meta.get("integration_data") or {}).get("cluster")
         return {
-            "name": attributes.get("name"),
-            "id": project.get("id"),
-            "created": attributes.get("created"),
-            "origin": attributes.get("origin"),
-            "type": attributes.get("type"),
-            "readOnly": attributes.get("read_only"),
-            "testFrequency": recurring_tests.get("frequency"),
-            "lastTestedDate": issue_counts.get("updated_at"),
-            "isMonitored": True if attributes.get("status") == "active" else False,
+            "name": _DGET(attributes, "name"),
+            "id": _DGET(project, "id"),
+            "created": _DGET(attributes, "created"),
+            "origin": _DGET(attributes, "origin"),
+            "type": _DGET(attributes, "type"),
+            "readOnly": _DGET(attributes, "read_only"),
+            "testFrequency": _DGET(recurring_tests, "frequency"),
+            "lastTestedDate": _DGET(issue_counts, "updated_at"),
+            # == already yields a bool, no ternary needed
+            "isMonitored": _DGET(attributes, "status") == "active",
             "issueCountsBySeverity": {
-                "low": issue_counts.get("low", 0),
-                "medium": issue_counts.get("medium", 0),
-                "high": issue_counts.get("high", 0),
-                "critical": issue_counts.get("critical", 0),
+                severity: _DGET(issue_counts, severity, 0) for severity in _SEVERITIES
             },
-            "targetReference": attributes.get("target_reference"),
-            "branch": attributes.get("target_reference"),
+            "targetReference": _DGET(attributes, "target_reference"),
+            "branch": _DGET(attributes, "target_reference"),
             "remoteRepoUrl": remote_repo_url,
             "imageCluster": image_cluster,
-            "_tags": attributes.get("tags", []),
-            "importingUserId": project.get("relationships", {})
-            .get("importer", {})
-            .get("data", {})
-            .get("id"),
-            "owningUserId": project.get("relationships", {})
-            .get("owner", {})
-            .get("data", {})
-            .get("id"),
+            "_tags": _DGET(attributes, "tags", []),
+            "importingUserId": _DGET(importer, "id"),
+            "owningUserId": _DGET(owner, "id"),
         }
 
-    def _query(self, tags: List[Dict[str, str]] = [], next_url: str = None):
+    # filter() kwargs the rest endpoint can apply server-side, mapped to its
+    # query parameter names
+    _filterable_fields = {"name": "names", "origin": "origins", "type": "types"}
+
+    # Extra params for the first page only; next links already embed them
+    _first_page_params = {"meta.latest_issue_counts": "true", "expand": "target"}
+
+    def _query(
+        self,
+        tags: Optional[List[Dict[str, str]]] = None,
+        params: Dict[str, Any] = None,
+        follow_next: bool = True,
+    ):
         projects = []
-        params: dict = {"limit": 100}
+        params = dict(params) if params else {}
+        params.setdefault("limit", 100)
         if self.instance:
-            path = "/orgs/%s/projects" % self.instance.id if not next_url else next_url
+            path = "/orgs/%s/projects" % self.instance.id
 
             # Append to params if we've got tags
             if tags:
                 for tag in tags:
-                    if "key" not in tag or "value" not in tag or len(tag.keys()) != 2:
+                    if "key" not in tag or "value" not in tag or len(tag) != 2:
                         raise SnykError("Each tag must contain only a key and a value")
                 data = [f'{d["key"]}:{d["value"]}' for d in tags]
                 params["tags"] = ",".join(data)
 
-            # Append the issue count param to the params if this is the first page
-            if not next_url:
-                params["meta.latest_issue_counts"] = "true"
-                params["expand"] = "target"
-
-            # And lastly, make the API call
-            resp = self.client.get(
-                path,
-                version="2023-06-19",
-                params=params,
-                exclude_version=True if next_url else False,
-            )
+            # The issue count param only applies to the first page
+            first_page_params = {**params, **self._first_page_params}
+
+            # Serialized once per query: the organization doesn't change
+            # between projects, so re-running to_dict per project per page
+            # would be pure waste
+            org_dict = self.instance.to_dict()
+
+            # Walk the pages iteratively, collecting into a single list: no
+            # recursion depth to worry about on large orgs, and no re-walking
+            # of earlier pages per level
+            next_url = None
+            while True:
+                # A next link comes back fully formed, params and all, so
+                # later pages carry the URL as-is instead of re-sending (and
+                # potentially double-encoding) the query
+                resp = self.client.get(
+                    next_url or path,
+                    version="2023-06-19",
+                    params=None if next_url else first_page_params,
+                    exclude_version=next_url is not None,
+                    exclude_params=next_url is not None,
+                )
+                body = parse_response_json(resp)
+                if "data" not in body:
+                    break
 
-            if "data" in resp.json():
                 # Process projects in current response
-                for response_data in resp.json()["data"]:
+                for response_data in body["data"]:
                     project_data = self._rest_to_v1_response_format(response_data)
-                    project_data["organization"] = self.instance.to_dict()
-                    try:
-                        project_data["attributes"]["_tags"] = project_data[
-                            "attributes"
-                        ]["tags"]
-                        del project_data["attributes"]["tags"]
-                    except KeyError:
-                        pass
+                    project_data["organization"] = org_dict
+                    # pop-based rename: no exception machinery on the miss path
+                    attrs = project_data.get("attributes")
+                    if attrs is not None and "tags" in attrs:
+                        attrs["_tags"] = attrs.pop("tags")
                     if not project_data.get("totalDependencies"):
                         project_data["totalDependencies"] = 0
                     projects.append(self.klass.from_dict(project_data))
 
-                # If we have another page, then process this page too
-                if "next" in resp.json().get("links", {}):
-                    next_url = resp.json().get("links", {})["next"]
-                    projects.extend(self._query(tags, next_url))
+                if not (follow_next and "next" in body.get("links", {})):
+                    break
+                next_url = body["links"]["next"]
 
+            # Bind the organization exactly once, after all pages are in
             for x in projects:
                 x.organization = self.instance
         else:
-            for org in self.client.organizations.all():
-                projects.extend(org.projects.all())
+            # Each org's listing is independent, so fetch them concurrently;
+            # the calls are I/O-bound and share the client's pooled session
+            orgs = self.client.organizations.all()
+            if orgs:
+                workers = min(MAX_CROSS_ORG_WORKERS, len(orgs))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for org_projects in executor.map(
+                        lambda org: org.projects.all(), orgs
+                    ):
+                        projects.extend(org_projects)
         return projects
 
     def all(self):
         return self._query()
 
-    def filter(self, tags: List[Dict[str, str]] = [], **kwargs: Any):
-        if tags:
-            return self._filter_by_kwargs(self._query(tags), **kwargs)
+    def filter(self, tags: Optional[List[Dict[str, str]]] = None, **kwargs: Any):
+        # Push the filters the rest endpoint understands into the query so the
+        # server prunes records before they're downloaded. The same kwargs are
+        # still applied client-side, so the result is unchanged
+        server_params = {
+            param: kwargs[field]
+            for field, param in self._filterable_fields.items()
+            if field in kwargs
+        }
+        if tags or server_params:
+            return self._filter_by_kwargs(
+                self._query(tags, params=server_params), **kwargs
+            )
         else:
             return super().filter(**kwargs)
 
+    def first(self):
+        if self.instance:
+            # Ask the server for a single record instead of paginating the
+            # entire project listing just to look at the first one
+            projects = self._query(params={"limit": 1}, follow_next=False)
+            if projects:
+                return projects[0]
+            raise SnykNotFoundError
+        return super().first()
+
     def get(self, id: str):
         if self.instance:
             path = "org/%s/project/%s" % (self.instance.id, id)
             resp = self.client.get(path)
-            project_data = resp.json()
+            project_data = parse_response_json(resp)
             project_data["organization"] = self.instance.to_dict()
             # We move tags to _tags as a cache, to avoid the need for additional requests
             # when working with tags. We want tags to be the manager
-            try:
-                project_data["_tags"] = project_data["tags"]
-                del project_data["tags"]
-            except KeyError:
-                pass
+            if "tags" in project_data:
+                project_data["_tags"] = project_data.pop("tags")
             if project_data.get("totalDependencies") is None:
                 project_data["totalDependencies"] = 0
             project_klass = self.klass.from_dict(project_data)
@@ -277,16 +406,20 @@ class ProjectManager(Manager):
 
 
 class MemberManager(Manager):
+    __slots__ = ()
+
     def all(self):
         path = "org/%s/members" % self.instance.id
         resp = self.client.get(path)
         members = []
-        for member_data in resp.json():
+        for member_data in parse_response_json(resp):
             members.append(self.klass.from_dict(member_data))
         return members
 
 
 class LicenseManager(Manager):
+    __slots__ = ()
+
     def all(self):
         if hasattr(self.instance, "organization"):
             path = "org/%s/licenses" % self.instance.organization.id
@@ -296,7 +429,7 @@ class LicenseManager(Manager):
             post_body: Dict[str, Dict[str, List[str]]] = {"filters": {}}
 
         resp = self.client.post(path, post_body)
-        license_data = resp.json()
+        license_data = parse_response_json(resp)
         licenses = []
         if "results" in license_data:
             for license in license_data["results"]:
@@ -305,109 +438,146 @@ class LicenseManager(Manager):
 
 
 class DependencyManager(Manager):
-    def all(self, page: int = 1):
-        results_per_page = 1000
+    __slots__ = ()
+
+    RESULTS_PER_PAGE = 1000
+
+    def _page_request(self):
         if hasattr(self.instance, "organization"):
             org_id = self.instance.organization.id
             post_body = {"filters": {"projects": [self.instance.id]}}
         else:
             org_id = self.instance.id
             post_body = {"filters": {}}
-
-        path = "org/%s/dependencies?sortBy=dependency&order=asc&page=%s&perPage=%s" % (
-            org_id,
-            page,
-            results_per_page,
+        path_format = (
+            "org/%s/dependencies?sortBy=dependency&order=asc&page=%%s&perPage=%s"
+            % (org_id, self.RESULTS_PER_PAGE)
         )
+        return path_format, post_body
 
-        resp = self.client.post(path, post_body)
-        dependency_data = resp.json()
+    def _fetch_page(self, path_format: str, post_body: dict, page: int) -> dict:
+        return parse_response_json(self.client.post(path_format % page, post_body))
+
+    def iterate(self, page: int = 1):
+        """
+        Yield dependencies page by page, so consumers that stop early only
+        pay for the pages they actually touch rather than materializing the
+        whole listing up front
+        """
+        path_format, post_body = self._page_request()
+
+        while True:
+            dependency_data = self._fetch_page(path_format, post_body, page)
 
-        total = dependency_data[
-            "total"
-        ]  # contains the total number of results (for pagination use)
+            total = dependency_data[
+                "total"
+            ]  # contains the total number of results (for pagination use)
 
-        results = [self.klass.from_dict(item) for item in dependency_data["results"]]
+            for item in dependency_data["results"]:
+                yield self.klass.from_dict(item)
 
-        if total > (page * results_per_page):
-            next_results = self.all(page + 1)
-            results.extend(next_results)
+            if total <= (page * self.RESULTS_PER_PAGE):
+                return
+            page += 1
 
+    def all(self, page: int = 1):
+        """
+        The first response exposes the result total, so after one round-trip
+        the page count is known and the remaining pages are fetched
+        concurrently instead of one behind the other
+        """
+        path_format, post_body = self._page_request()
+        first_page = self._fetch_page(path_format, post_body, page)
+        results = [self.klass.from_dict(item) for item in first_page["results"]]
+
+        last_page = -(-first_page["total"] // self.RESULTS_PER_PAGE)
+        remaining = range(page + 1, last_page + 1)
+        if remaining:
+            workers = min(MAX_CROSS_ORG_WORKERS, len(remaining))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map preserves page order in the merged results
+                for page_data in executor.map(
+                    lambda p: self._fetch_page(path_format, post_body, p), remaining
+                ):
+                    results.extend(
+                        self.klass.from_dict(item) for item in page_data["results"]
+                    )
         return results
 
 
 class EntitlementManager(DictManager):
+    __slots__ = ()
+
     def all(self) -> Dict[str, bool]:
         path = "org/%s/entitlements" % self.instance.id
         resp = self.client.get(path)
-        return resp.json()
+        return parse_response_json(resp)
+
+
+# The updatable project settings, converted to their camelCase API names
+# once at import rather than on every SettingManager.update call
+_SETTING_MAP = {
+    name: snake_to_camel(name)
+    for name in (
+        "auto_dep_upgrade_enabled",
+        "auto_dep_upgrade_ignored_dependencies",
+        "auto_dep_upgrade_min_age",
+        "auto_dep_upgrade_limit",
+        "pull_request_fail_on_any_vulns",
+        "pull_request_fail_only_for_high_severity",
+        "pull_request_test_enabled",
+        "pull_request_assignment",
+        "pull_request_inheritance",
+        "pull_request_fail_only_for_issues_with_fix",
+        "auto_remediation_prs",
+    )
+}
 
 
 class SettingManager(DictManager):
+    __slots__ = ()
+
     def all(self) -> Dict[str, Any]:
-        path = "org/%s/project/%s/settings" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
+        path = self._project_base_path() + "/settings"
         resp = self.client.get(path)
-        return resp.json()
+        return parse_response_json(resp)
 
     def update(self, **kwargs: bool) -> bool:
-        path = "org/%s/project/%s/settings" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
-        post_body = {}
-
-        settings = [
-            "auto_dep_upgrade_enabled",
-            "auto_dep_upgrade_ignored_dependencies",
-            "auto_dep_upgrade_min_age",
-            "auto_dep_upgrade_limit",
-            "pull_request_fail_on_any_vulns",
-            "pull_request_fail_only_for_high_severity",
-            "pull_request_test_enabled",
-            "pull_request_assignment",
-            "pull_request_inheritance",
-            "pull_request_fail_only_for_issues_with_fix",
-            "auto_remediation_prs",
-        ]
-
-        for setting in settings:
-            if setting in kwargs:
-                post_body[snake_to_camel(setting)] = kwargs[setting]
+        path = self._project_base_path() + "/settings"
+        post_body = {
+            camel: kwargs[snake]
+            for snake, camel in _SETTING_MAP.items()
+            if snake in kwargs
+        }
 
-        return bool(self.client.put(path, post_body))
+        self._all_cache = None
+        resp = self.client.put(path, post_body)
+        return 200 <= resp.status_code < 300
 
 
 class IgnoreManager(DictManager):
+    __slots__ = ()
+
     def all(self) -> Dict[str, List[object]]:
-        path = "org/%s/project/%s/ignores" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
+        path = self._project_base_path() + "/ignores"
         resp = self.client.get(path)
-        return resp.json()
+        return parse_response_json(resp)
 
 
 class JiraIssueManager(DictManager):
+    __slots__ = ()
+
     def all(self) -> Dict[str, List[object]]:
-        path = "org/%s/project/%s/jira-issues" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
+        path = self._project_base_path() + "/jira-issues"
         resp = self.client.get(path)
-        return resp.json()
+        return parse_response_json(resp)
 
     def create(self, issue_id: str, fields: Any) -> Dict[str, str]:
-        path = "org/%s/project/%s/issue/%s/jira-issue" % (
-            self.instance.organization.id,
-            self.instance.id,
-            issue_id,
-        )
+        path = "%s/issue/%s/jira-issue" % (self._project_base_path(), issue_id)
         post_body = {"fields": fields}
+        self._all_cache = None
         resp = self.client.post(path, post_body)
-        response_data = resp.json()
+        response_data = parse_response_json(resp)
         # The response we get is not following the schema as specified by the api
         # https://snyk.docs.apiary.io/#reference/projects/project-jira-issues-/create-jira-issue
         if (
@@ -420,112 +590,136 @@ class JiraIssueManager(DictManager):
 
 
 class IntegrationManager(Manager):
+    __slots__ = ()
+
     def all(self):
         path = "org/%s/integrations" % self.instance.id
         resp = self.client.get(path)
+        body = parse_response_json(resp)
+        organization = self.instance
         integrations = []
-        integrations_data = [{"name": x, "id": resp.json()[x]} for x in resp.json()]
-        for data in integrations_data:
-            integrations.append(self.klass.from_dict(data))
-        for integration in integrations:
-            integration.organization = self.instance
+        # One pass: build each integration and bind its organization as we go.
+        # An org without integrations comes back as an empty list, not a dict
+        for name, integration_id in body.items() if body else ():
+            integration = self.klass.from_dict({"name": name, "id": integration_id})
+            integration.organization = organization
+            integrations.append(integration)
         return integrations
 
 
 class IntegrationSettingManager(DictManager):
+    __slots__ = ()
+
     def all(self):
         path = "org/%s/integrations/%s/settings" % (
             self.instance.organization.id,
             self.instance.id,
         )
         resp = self.client.get(path)
-        return resp.json()
+        return parse_response_json(resp)
 
 
 class DependencyGraphManager(SingletonManager):
+    __slots__ = ()
+
     def all(self) -> Any:
-        path = "org/%s/project/%s/dep-graph" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
+        path = self._project_base_path() + "/dep-graph"
         resp = self.client.get(path)
-        dependency_data = resp.json()
+        dependency_data = parse_response_json(resp)
         if "depGraph" in dependency_data:
             return self.klass.from_dict(dependency_data["depGraph"])
         raise SnykError
 
 
+# Default issue filters, built once at import. filter() merges these with a
+# shallow {**...} copy so the shared defaults are never mutated per call
+_ISSUE_SET_DEFAULT_FILTERS = {
+    "severities": ["critical", "high", "medium", "low"],
+    "types": ["vuln", "license"],
+    "ignored": False,
+    "patched": False,
+}
+
+_AGGREGATED_DEFAULT_FILTERS = {
+    "severities": ["critical", "high", "medium", "low"],
+    "exploitMaturity": [
+        "mature",
+        "proof-of-concept",
+        "no-known-exploit",
+        "no-data",
+    ],
+    "types": ["vuln", "license"],
+    "priority": {"score": {"min": 0, "max": 1000}},
+}
+
+_AGGREGATED_FILTER_NAMES = (*_AGGREGATED_DEFAULT_FILTERS, "ignored", "patched")
+
+
 @deprecated("API has been removed, use IssueSetAggregatedManager instead")
 class IssueSetManager(SingletonManager):
+    __slots__ = ()
+
     def _convert_reserved_words(self, data):
-        for key in ["vulnerabilities", "licenses"]:
-            if "issues" in data and key in data["issues"]:
-                for i, vuln in enumerate(data["issues"][key]):
+        issues = data.get("issues")
+        if issues:
+            for key in ("vulnerabilities", "licenses"):
+                # Renaming through the loop variable mutates the same dicts
+                # the lists hold, without re-subscripting data per item
+                for vuln in issues.get(key, ()):
                     if "from" in vuln:
-                        data["issues"][key][i]["fromPackages"] = data["issues"][key][
-                            i
-                        ].pop("from")
+                        vuln["fromPackages"] = vuln.pop("from")
         return data
 
     def all(self) -> Any:
         return self.filter()
 
     def filter(self, **kwargs: Any):
-        path = "org/%s/project/%s/issues" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
+        path = self._project_base_path() + "/issues"
         filters = {
-            "severities": ["critical", "high", "medium", "low"],
-            "types": ["vuln", "license"],
-            "ignored": False,
-            "patched": False,
+            **_ISSUE_SET_DEFAULT_FILTERS,
+            **{
+                name: kwargs[name]
+                for name in _ISSUE_SET_DEFAULT_FILTERS
+                if kwargs.get(name)
+            },
         }
-        for filter_name in filters.keys():
-            if kwargs.get(filter_name):
-                filters[filter_name] = kwargs[filter_name]
         post_body = {"filters": filters}
         resp = self.client.post(path, post_body)
-        return self.klass.from_dict(self._convert_reserved_words(resp.json()))
+        return self.klass.from_dict(
+            self._convert_reserved_words(parse_response_json(resp))
+        )
 
 
 class IssueSetAggregatedManager(SingletonManager):
+    __slots__ = ()
+
     def all(self) -> Any:
         return self.filter()
 
     def filter(self, **kwargs: Any):
-        path = "org/%s/project/%s/aggregated-issues" % (
-            self.instance.organization.id,
-            self.instance.id,
-        )
-        default_filters = {
-            "severities": ["critical", "high", "medium", "low"],
-            "exploitMaturity": [
-                "mature",
-                "proof-of-concept",
-                "no-known-exploit",
-                "no-data",
-            ],
-            "types": ["vuln", "license"],
-            "priority": {"score": {"min": 0, "max": 1000}},
+        path = self._project_base_path() + "/aggregated-issues"
+        post_body = {
+            "filters": {
+                **_AGGREGATED_DEFAULT_FILTERS,
+                **{
+                    name: kwargs[name]
+                    for name in _AGGREGATED_FILTER_NAMES
+                    if name in kwargs
+                },
+            }
         }
 
-        post_body = {"filters": default_filters}
-
-        all_filters = list(default_filters.keys()) + ["ignored", "patched"]
-        for filter_name in all_filters:
-            if filter_name in kwargs.keys():
-                post_body["filters"][filter_name] = kwargs[filter_name]
-
-        for optional_field in ["includeDescription", "includeIntroducedThrough"]:
-            if optional_field in kwargs.keys():
+        for optional_field in ("includeDescription", "includeIntroducedThrough"):
+            if optional_field in kwargs:
                 post_body[optional_field] = kwargs[optional_field]
 
         resp = self.client.post(path, post_body)
-        return self.klass.from_dict(resp.json())
+        return self.klass.from_dict(parse_response_json(resp))
 
 
 class IssuePathsManager(SingletonManager):
+    __slots__ = ()
+
     def all(self):
         path = "org/%s/project/%s/issue/%s/paths" % (
             self.instance.organization_id,
@@ -533,4 +727,26 @@ class IssuePathsManager(SingletonManager):
             self.instance.id,
         )
         resp = self.client.get(path)
-        return self.klass.from_dict(resp.json())
+        return self.klass.from_dict(parse_response_json(resp))
+
+
+# Built once at import so factory is a plain dict lookup per call rather than
+# a fresh dict literal allocation
+_MANAGER_REGISTRY = {
+    "Project": ProjectManager,
+    "Organization": OrganizationManager,
+    "Member": MemberManager,
+    "License": LicenseManager,
+    "Dependency": DependencyManager,
+    "Entitlement": EntitlementManager,
+    "Setting": SettingManager,
+    "Ignore": IgnoreManager,
+    "JiraIssue": JiraIssueManager,
+    "DependencyGraph": DependencyGraphManager,
+    "IssueSet": IssueSetManager,
+    "IssueSetAggregated": IssueSetAggregatedManager,
+    "Integration": IntegrationManager,
+    "IntegrationSetting": IntegrationSettingManager,
+    "Tag": TagManager,
+    "IssuePaths": IssuePathsManager,
+}
@@ -1,14 +1,26 @@
 import base64
 import re
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Type, Union
 
 import requests
 from deprecation import deprecated  # type: ignore
 from mashumaro.mixins.json import DataClassJSONMixin  # type: ignore
 
 from .errors import SnykError, SnykNotImplementedError
-from .managers import Manager
+from .managers import (
+    DependencyGraphManager,
+    DependencyManager,
+    IntegrationManager,
+    IssuePathsManager,
+    IssueSetAggregatedManager,
+    IssueSetManager,
+    LicenseManager,
+    Manager,
+    MemberManager,
+    OrganizationManager,
+    ProjectManager,
+)
 from .utils import flat_map, format_package
 
 
@@ -69,6 +81,8 @@ class Issue(DataClassJSONMixin):
 
 @dataclass
 class IssueSet(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     ok: bool
     packageManager: str
     dependencyCount: int
@@ -128,6 +142,8 @@ class AggregatedIssue(DataClassJSONMixin):
 
 @dataclass
 class IssueSetAggregated(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     issues: List[AggregatedIssue]
 
 
@@ -146,6 +162,8 @@ class Package(DataClassJSONMixin):
 
 @dataclass
 class IssuePaths(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     snapshotId: str
     paths: List[List[Package]]
     total: int
@@ -160,6 +178,8 @@ class IssueRelations:
 
 @dataclass
 class Organization(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     name: str
     id: str
     slug: str
@@ -357,6 +377,8 @@ class Organization(DataClassJSONMixin):
 
 @dataclass
 class Integration(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     name: str
     id: str
     organization: Optional[Organization] = None
@@ -469,6 +491,8 @@ class LicenseProject(DataClassJSONMixin):
 
 @dataclass
 class License(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     id: str
     dependencies: List[LicenseDependency]
     projects: List[LicenseProject]
@@ -477,6 +501,8 @@ class License(DataClassJSONMixin):
 
 @dataclass
 class Member(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     id: str
     username: str
     name: str
@@ -528,6 +554,8 @@ class Graph(DataClassJSONMixin):
 
 @dataclass
 class DependencyGraph(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     schemaVersion: str
     pkgManager: Dict[str, str]
     pkgs: List[DependencyGraphPackage]
@@ -549,6 +577,8 @@ class DependencyProject(DataClassJSONMixin):
 
 @dataclass
 class Dependency(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     id: str
     name: str
     version: str
@@ -573,6 +603,8 @@ class User(DataClassJSONMixin):
 
 @dataclass
 class Project(DataClassJSONMixin):
+    _manager_cls: ClassVar[Type[Manager]]
+
     name: str
     organization: Organization
     id: str
@@ -593,8 +625,21 @@ class Project(DataClassJSONMixin):
     attributes: Optional[Dict[str, List[str]]] = None
     _tags: Optional[List[Any]] = field(default_factory=list)
 
+    @property
+    def _api_base(self) -> str:
+        """
+        The "org/<org_id>/project/<project_id>" path prefix shared by every
+        project-scoped endpoint, formatted once per project rather than on
+        each call
+        """
+        base = getattr(self, "_api_base_cached", None)
+        if base is None:
+            base = "org/%s/project/%s" % (self.organization.id, self.id)
+            self._api_base_cached = base
+        return base
+
     def delete(self) -> bool:
-        path = "org/%s/project/%s" % (self.organization.id, self.id)
+        path = self._api_base
 
         if self.organization.client is None:
             raise SnykError
@@ -602,7 +647,7 @@ class Project(DataClassJSONMixin):
         return bool(self.organization.client.delete(path))
 
     def activate(self) -> bool:
-        path = "org/%s/project/%s/activate" % (self.organization.id, self.id)
+        path = self._api_base + "/activate"
 
         if self.organization.client is None:
             raise SnykError
@@ -610,7 +655,7 @@ class Project(DataClassJSONMixin):
         return bool(self.organization.client.post(path, {}))
 
     def deactivate(self) -> bool:
-        path = "org/%s/project/%s/deactivate" % (self.organization.id, self.id)
+        path = self._api_base + "/deactivate"
 
         if self.organization.client is None:
             raise SnykError
@@ -618,7 +663,7 @@ class Project(DataClassJSONMixin):
         return bool(self.organization.client.post(path, {}))
 
     def move(self, new_org_id: str) -> bool:
-        path = "org/%s/project/%s/move" % (self.organization.id, self.id)
+        path = self._api_base + "/move"
 
         payload = {"targetOrgId": new_org_id}
 
@@ -805,3 +850,17 @@ class Project(DataClassJSONMixin):
             # versions, emulate that here to preserve upstream api
             for version in issue.pkgVersions
         ]
+
+
+# Bind each model class to its manager so Manager.factory dispatches with a
+# single attribute read; string keys keep using the registry in managers.py
+Organization._manager_cls = OrganizationManager
+Project._manager_cls = ProjectManager
+Member._manager_cls = MemberManager
+License._manager_cls = LicenseManager
+Dependency._manager_cls = DependencyManager
+DependencyGraph._manager_cls = DependencyGraphManager
+Integration._manager_cls = IntegrationManager
+IssueSet._manager_cls = IssueSetManager
+IssueSetAggregated._manager_cls = IssueSetAggregatedManager
+IssuePaths._manager_cls = IssuePathsManager
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest  # type: ignore
+
+from snyk import AsyncSnykClient
+from snyk.__version__ import __version__
+
+
+class TestAsyncSnykClient(object):
+    @pytest.fixture
+    def client(self):
+        client = AsyncSnykClient("token")
+        yield client
+        asyncio.run(client.aclose())
+
+    def test_default_api_url(self, client):
+        assert client.api_url == "https://api.snyk.io/v1"
+
+    def test_default_rest_api_url(self, client):
+        assert client.rest_api_url == "https://api.snyk.io/rest"
+
+    def test_overriding_api_url(self):
+        url = "https://api.notsnyk.io/v1"
+
+        async def make_client():
+            async with AsyncSnykClient("token", url) as client:
+                return client.api_url
+
+        assert asyncio.run(make_client()) == url
+
+    def test_token_added_to_headers(self, client):
+        assert client.api_headers["Authorization"] == "token token"
+
+    def test_user_agent_added_to_headers(self, client):
+        assert client.api_headers["User-Agent"] == "pysnyk/%s" % __version__
+
+    def test_overriding_user_agent(self):
+        ua = "test"
+
+        async def make_client():
+            async with AsyncSnykClient("token", user_agent=ua) as client:
+                return client.api_headers["User-Agent"]
+
+        assert asyncio.run(make_client()) == ua
+
+    def test_token_added_to_post_headers(self, client):
+        assert client.api_post_headers["Authorization"] == "token token"
+
+    def test_post_headers_use_correct_mimetype(self, client):
+        assert client.api_post_headers["Content-Type"] == "application/json"
+
+    def test_context_manager_closes_client(self):
+        async def close_via_context_manager():
+            async with AsyncSnykClient("token") as client:
+                assert not client._client.is_closed
+            return client._client.is_closed
+
+        assert asyncio.run(close_via_context_manager())
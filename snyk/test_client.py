@@ -1,7 +1,11 @@
+import functools
+import json
 import os
 import re
 
 import pytest  # type: ignore
+import requests
+import requests_mock as requests_mock_lib
 
 from snyk import SnykClient
 from snyk.__version__ import __version__
@@ -11,6 +15,14 @@ from snyk.utils import load_test_data
 
 TEST_DATA = os.path.join(os.path.dirname(__file__), "test_data")
 
+
+# The same JSON blobs back many tests; read and parse each file once per
+# session instead of once per test
+@functools.lru_cache(maxsize=None)
+def _cached_load(name: str) -> dict:
+    return load_test_data(TEST_DATA, name)
+
+
 REST_ORG = "39ddc762-b1b9-41ce-ab42-defbe4575bd6"
 REST_URL = "https://api.snyk.io/rest"
 REST_VERSION = "2022-02-16~experimental"
@@ -20,8 +32,23 @@ V3_URL = "https://api.snyk.io/v3"
 V3_VERSION = "2022-02-16~experimental"
 
 
+def mock_project_routes(requests_mock, organizations, **kwargs):
+    """
+    Register the exact per-org rest project listing URLs, so requests_mock
+    dispatches on a plain URL lookup instead of running a regex against
+    every outbound request
+    """
+    for org in organizations["orgs"]:
+        requests_mock.get(
+            "https://api.snyk.io/rest/orgs/%s/projects" % org["id"], **kwargs
+        )
+
+
 class TestSnykClient(object):
-    @pytest.fixture
+    # Module scope: the client keeps no per-test state (caching is off by
+    # default and managers are created per access), so one instance serves
+    # every test and skips repeated session/adapter construction
+    @pytest.fixture(scope="module")
     def client(self):
         return SnykClient("token")
 
@@ -67,76 +94,134 @@ class TestSnykClient(object):
         assert client.post("sample", {})
         assert requests_mock.call_count == 1
 
-    def test_post_raises_error(self, requests_mock, client):
-        requests_mock.post("https://api.snyk.io/v1/sample", status_code=500, json={})
+    @pytest.mark.parametrize("verb", ["get", "post", "put", "delete"])
+    def test_verb_raises_error(self, requests_mock, client, verb):
+        getattr(requests_mock, verb)(
+            "https://api.snyk.io/v1/sample", status_code=500, json={}
+        )
+        args = ("sample",) if verb in ("get", "delete") else ("sample", {})
         with pytest.raises(SnykError):
-            client.post("sample", {})
+            getattr(client, verb)(*args)
         assert requests_mock.call_count == 1
 
-    def test_put_retries_and_raises_error(self, requests_mock, client):
-        requests_mock.put("https://api.snyk.io/v1/sample", status_code=500, json={})
-        client = SnykClient("token", tries=4, delay=0, backoff=2)
-        with pytest.raises(SnykError):
-            client.put("sample", {})
-        assert requests_mock.call_count == 4
-
-    def test_delete_retries_and_raises_error(self, requests_mock, client):
-        requests_mock.delete("https://api.snyk.io/v1/sample", status_code=500, json={})
-        client = SnykClient("token", tries=4, delay=0, backoff=2)
-        with pytest.raises(SnykError):
-            client.delete("sample")
-        assert requests_mock.call_count == 4
-
-    def test_get_retries_and_raises_error(self, requests_mock, client):
-        requests_mock.get("https://api.snyk.io/v1/sample", status_code=500, json={})
-        client = SnykClient("token", tries=4, delay=0, backoff=2)
-        with pytest.raises(SnykError):
-            client.get("sample")
-        assert requests_mock.call_count == 4
-
-    def test_post_retries_and_raises_error(self, requests_mock, client):
-        requests_mock.post("https://api.snyk.io/v1/sample", status_code=500, json={})
-        client = SnykClient("token", tries=4, delay=0, backoff=2)
-        with pytest.raises(SnykError):
-            client.post("sample", {})
-        assert requests_mock.call_count == 4
-
-    def test_put_raises_error(self, requests_mock, client):
-        requests_mock.put("https://api.snyk.io/v1/sample", status_code=500, json={})
-        with pytest.raises(SnykError):
-            client.put("sample", {})
-        assert requests_mock.call_count == 1
+    def test_client_reuses_session(self, client):
+        # Keep-alive wiring: one Session means pooled connections are reused
+        # across calls instead of re-negotiating TLS per request
+        assert isinstance(client._session, requests.Session)
+
+    def test_client_has_pooled_adapter(self, client):
+        adapter = client._session.get_adapter("https://api.snyk.io")
+        assert adapter._pool_maxsize >= 10
+
+    def test_no_retries_by_default(self, client):
+        retries = client._session.get_adapter("https://api.snyk.io").max_retries
+        assert retries.total == 0
+
+    @pytest.fixture(scope="module")
+    def retry_client(self):
+        return SnykClient("token", tries=4, delay=1, backoff=2)
+
+    def test_retries_mounted_on_adapter(self, retry_client):
+        retries = retry_client._session.get_adapter("https://api.snyk.io").max_retries
+        assert retries.total == 3
+        assert retries.backoff_factor == 1
+        assert retries.respect_retry_after_header
+        assert 429 in retries.status_forcelist
+
+    def test_zero_delay_disables_backoff_sleep(self):
+        # urllib3 computes backoff as backoff_factor * 2**n, so delay=0 means
+        # retries never sleep; pinned here so a refactor can't reintroduce a
+        # sleep floor
+        client = SnykClient("token", tries=4, delay=0)
+        retries = client._session.get_adapter("https://api.snyk.io").max_retries
+        assert retries.backoff_factor == 0
+        assert retries.get_backoff_time() == 0
+
+    def test_get_with_fully_formed_url(self, requests_mock, client):
+        requests_mock.get("https://api.custom.example.com/v1/sample", text="pong")
+        assert client.get("https://api.custom.example.com/v1/sample")
+
+    def test_fetch_many(self, requests_mock, client):
+        requests_mock.get("https://api.snyk.io/v1/first", json={"id": 1})
+        requests_mock.get("https://api.snyk.io/v1/second", json={"id": 2})
+        assert client.fetch_many(["first", "second"]) == [{"id": 1}, {"id": 2}]
+        assert requests_mock.call_count == 2
+
+    def test_get_not_cached_by_default(self, requests_mock, client):
+        requests_mock.get("https://api.snyk.io/v1/sample", text="pong")
+        client.get("sample")
+        client.get("sample")
+        assert requests_mock.call_count == 2
 
-    def test_delete_raises_error(self, requests_mock, client):
-        requests_mock.delete("https://api.snyk.io/v1/sample", status_code=500, json={})
-        with pytest.raises(SnykError):
-            client.delete("sample")
+    def test_get_served_from_cache_within_ttl(self, requests_mock):
+        requests_mock.get("https://api.snyk.io/v1/sample", text="pong")
+        client = SnykClient("token", cache_ttl=60)
+        client.get("sample")
+        assert client.get("sample").text == "pong"
         assert requests_mock.call_count == 1
 
-    def test_get_raises_error(self, requests_mock, client):
-        requests_mock.get("https://api.snyk.io/v1/sample", status_code=500, json={})
-        with pytest.raises(SnykError):
-            client.get("sample")
-        assert requests_mock.call_count == 1
+    def test_post_invalidates_get_cache(self, requests_mock):
+        requests_mock.get("https://api.snyk.io/v1/sample", text="pong")
+        requests_mock.post("https://api.snyk.io/v1/sample")
+        client = SnykClient("token", cache_ttl=60)
+        client.get("sample")
+        client.post("sample", {})
+        client.get("sample")
+        assert requests_mock.call_count == 3
+
+    def test_post_invalidates_only_matching_org_scope(self, requests_mock):
+        requests_mock.get("https://api.snyk.io/v1/org/one/members", text="[]")
+        requests_mock.get("https://api.snyk.io/v1/org/two/members", text="[]")
+        requests_mock.post("https://api.snyk.io/v1/org/one/licenses")
+        client = SnykClient("token", cache_ttl=60)
+        client.get("org/one/members")
+        client.get("org/two/members")
+        client.post("org/one/licenses", {})
+        client.get("org/one/members")
+        client.get("org/two/members")
+        # org/one was re-fetched after the write, org/two stayed cached
+        assert requests_mock.call_count == 4
 
     def test_empty_organizations(self, requests_mock, client):
         requests_mock.get("https://api.snyk.io/v1/orgs", json={})
         assert [] == client.organizations.all()
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def organizations(self):
-        return load_test_data(TEST_DATA, "organizations")
+        return _cached_load("organizations")
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def projects(self):
-        return load_test_data(TEST_DATA, "projects")
-
-    def test_loads_organizations(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
+        return _cached_load("projects")
+
+    @pytest.fixture(scope="session")
+    def default_org_id(self, organizations):
+        return organizations["orgs"][0]["id"]
+
+    # Pre-encoded bodies: passing json= to requests_mock re-serializes the
+    # payload every time the route is hit, passing text= serves cached bytes
+    @pytest.fixture(scope="session")
+    def organizations_json(self, organizations):
+        return json.dumps(organizations)
+
+    @pytest.fixture(scope="session")
+    def projects_json(self, projects):
+        return json.dumps(projects)
+
+    # Registers the organization listing route once per module; most tests
+    # below only differ in the call they make against it. A manual Mocker
+    # avoids rebuilding the adapter patch for every test, and tests that use
+    # the function-scoped requests_mock fixture nest inside it cleanly
+    @pytest.fixture(scope="module")
+    def mock_orgs(self, organizations_json):
+        with requests_mock_lib.Mocker() as m:
+            m.get("https://api.snyk.io/v1/orgs", text=organizations_json)
+            yield m
+
+    def test_loads_organizations(self, mock_orgs, client):
         assert len(client.organizations.all()) == 2
 
-    def test_first_organizations(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
+    def test_first_organizations(self, mock_orgs, client):
         org = client.organizations.first()
         assert "defaultOrg" == org.name
 
@@ -145,114 +230,102 @@ class TestSnykClient(object):
         with pytest.raises(SnykNotFoundError):
             client.organizations.first()
 
-    def test_filter_organizations(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
+    def test_filter_organizations(self, mock_orgs, client):
         assert 1 == len(client.organizations.filter(name="defaultOrg"))
 
-    def test_filter_organizations_empty(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
+    def test_filter_organizations_empty(self, mock_orgs, client):
         assert [] == client.organizations.filter(name="not present")
 
-    def test_loads_organization(self, requests_mock, client, organizations):
-        key = organizations["orgs"][0]["id"]
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
-        org = client.organizations.get(key)
+    def test_loads_organization(self, mock_orgs, client, default_org_id):
+        org = client.organizations.get(default_org_id)
         assert "defaultOrg" == org.name
 
-    def test_non_existent_organization(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
+    def test_non_existent_organization(self, mock_orgs, client):
         with pytest.raises(SnykNotFoundError):
             client.organizations.get("not-present")
 
-    def test_organization_type(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
-        assert all(type(x) is Organization for x in client.organizations.all())
+    def test_organization_type(self, mock_orgs, client):
+        organizations = client.organizations.all()
+        assert {type(x) for x in organizations} == {Organization}
 
-    def test_organization_attributes(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
+    def test_organization_attributes(self, mock_orgs, client):
         assert client.organizations.first().name == "defaultOrg"
 
-    def test_organization_load_group(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
+    def test_organization_load_group(self, mock_orgs, client):
         assert client.organizations.all()[1].group.name == "ACME Inc."
 
-    def test_empty_projects(self, requests_mock, client, organizations):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
-        matcher = re.compile("projects.*$")
-        requests_mock.get(matcher, json={})
+    # The project tests register routes on the function-scoped mocker, which
+    # nests inside (and masks) the module-scoped one, so the orgs route is
+    # registered here as well
+    def test_empty_projects(
+        self, requests_mock, client, organizations, organizations_json
+    ):
+        requests_mock.get("https://api.snyk.io/v1/orgs", text=organizations_json)
+        mock_project_routes(requests_mock, organizations, json={})
         assert [] == client.projects.all()
 
-    def test_projects(self, requests_mock, client, organizations, projects):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
-        matcher = re.compile("projects.*$")
-        requests_mock.get(matcher, json=projects)
-        assert len(client.projects.all()) == 2
-        assert all(type(x) is Project for x in client.projects.all())
-
-    def test_project(self, requests_mock, client, organizations, projects):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
-        matcher = re.compile("projects.*$")
-        requests_mock.get(matcher, json=projects)
+    def test_projects(
+        self, requests_mock, client, organizations, organizations_json, projects_json
+    ):
+        requests_mock.get("https://api.snyk.io/v1/orgs", text=organizations_json)
+        mock_project_routes(requests_mock, organizations, text=projects_json)
+        # Fetch once; a second .all() would replay the mocked round-trips
+        projects = client.projects.all()
+        assert len(projects) == 2
+        assert {type(x) for x in projects} == {Project}
+
+    def test_project(
+        self, requests_mock, client, organizations, organizations_json, projects_json
+    ):
+        requests_mock.get("https://api.snyk.io/v1/orgs", text=organizations_json)
+        mock_project_routes(requests_mock, organizations, text=projects_json)
         assert (
             "testing-new-name"
             == client.projects.get("f9fec29a-d288-40d9-a019-cedf825e6efb").name
         )
 
-    def test_non_existent_project(self, requests_mock, client, organizations, projects):
-        requests_mock.get("https://api.snyk.io/v1/orgs", json=organizations)
-        matcher = re.compile("projects.*$")
-        requests_mock.get(matcher, json=projects)
+    def test_non_existent_project(
+        self, requests_mock, client, organizations, organizations_json, projects_json
+    ):
+        requests_mock.get("https://api.snyk.io/v1/orgs", text=organizations_json)
+        mock_project_routes(requests_mock, organizations, text=projects_json)
         with pytest.raises(SnykNotFoundError):
             client.projects.get("not-present")
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def rest_client(self):
         return SnykClient(
             "token", version="2022-02-16~experimental", url="https://api.snyk.io/rest"
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def v3_client(self):
         return SnykClient(
             "token", version="2022-02-16~experimental", url="https://api.snyk.io/v3"
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def v3_groups(self):
-        return load_test_data(TEST_DATA, "v3_groups")
-
-    @pytest.fixture
-    def v3_targets_page1(self):
-        return load_test_data(TEST_DATA, "v3_targets_page1")
+        return _cached_load("v3_groups")
 
-    @pytest.fixture
-    def v3_targets_page2(self):
-        return load_test_data(TEST_DATA, "v3_targets_page2")
+    # One fixture per paginated listing rather than one per page: fewer
+    # fixture-graph entries and a single place to add pages
+    @pytest.fixture(scope="session")
+    def v3_target_pages(self):
+        return [_cached_load("v3_targets_page%d" % page) for page in (1, 2, 3)]
 
-    @pytest.fixture
-    def v3_targets_page3(self):
-        return load_test_data(TEST_DATA, "v3_targets_page3")
-
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def rest_groups(self):
-        return load_test_data(TEST_DATA, "rest_groups")
-
-    @pytest.fixture
-    def rest_targets_page1(self):
-        return load_test_data(TEST_DATA, "rest_targets_page1")
+        return _cached_load("rest_groups")
 
-    @pytest.fixture
-    def rest_targets_page2(self):
-        return load_test_data(TEST_DATA, "rest_targets_page2")
+    @pytest.fixture(scope="session")
+    def rest_target_pages(self):
+        return [_cached_load("rest_targets_page%d" % page) for page in (1, 2, 3)]
 
-    @pytest.fixture
-    def rest_targets_page3(self):
-        return load_test_data(TEST_DATA, "rest_targets_page3")
-
-    def test_v3get(self, requests_mock, v3_client, v3_targets_page1):
+    def test_v3get(self, requests_mock, v3_client, v3_target_pages):
         requests_mock.get(
             f"{V3_URL}/orgs/{V3_ORG}/targets?limit=10&version={V3_VERSION}",
-            json=v3_targets_page1,
+            json=v3_target_pages[0],
         )
         t_params = {"limit": 10}
 
@@ -260,25 +333,18 @@ class TestSnykClient(object):
 
         assert len(targets["data"]) == 10
 
-    def test_get_v3_pages(
-        self,
-        requests_mock,
-        v3_client,
-        v3_targets_page1,
-        v3_targets_page2,
-        v3_targets_page3,
-    ):
+    def test_get_v3_pages(self, requests_mock, v3_client, v3_target_pages):
         requests_mock.get(
             f"{V3_URL}/orgs/{V3_ORG}/targets?limit=10&version={V3_VERSION}",
-            json=v3_targets_page1,
+            json=v3_target_pages[0],
         )
         requests_mock.get(
             f"{V3_URL}/orgs/{V3_ORG}/targets?limit=10&version={V3_VERSION}&excludeEmpty=true&starting_after=v1.eyJpZCI6IjMyODE4ODAifQ%3D%3D",
-            json=v3_targets_page2,
+            json=v3_target_pages[1],
         )
         requests_mock.get(
             f"{V3_URL}/orgs/{V3_ORG}/targets?limit=10&version={V3_VERSION}&excludeEmpty=true&starting_after=v1.eyJpZCI6IjI5MTk1NjgifQ%3D%3D",
-            json=v3_targets_page3,
+            json=v3_target_pages[2],
         )
         t_params = {"limit": 10}
 
@@ -286,10 +352,10 @@ class TestSnykClient(object):
 
         assert len(data) == 30
 
-    def test_rest_get(self, requests_mock, rest_client, rest_targets_page1):
+    def test_rest_get(self, requests_mock, rest_client, rest_target_pages):
         requests_mock.get(
             f"{REST_URL}/orgs/{REST_ORG}/targets?limit=10&version={REST_VERSION}",
-            json=rest_targets_page1,
+            json=rest_target_pages[0],
         )
         t_params = {"limit": 10}
 
@@ -297,25 +363,18 @@ class TestSnykClient(object):
 
         assert len(targets["data"]) == 10
 
-    def test_get_rest_pages(
-        self,
-        requests_mock,
-        rest_client,
-        rest_targets_page1,
-        rest_targets_page2,
-        rest_targets_page3,
-    ):
+    def test_get_rest_pages(self, requests_mock, rest_client, rest_target_pages):
         requests_mock.get(
             f"{REST_URL}/orgs/{REST_ORG}/targets?limit=10&version={REST_VERSION}",
-            json=rest_targets_page1,
+            json=rest_target_pages[0],
         )
         requests_mock.get(
             f"{REST_URL}/orgs/{REST_ORG}/targets?limit=10&version={REST_VERSION}&excludeEmpty=true&starting_after=v1.eyJpZCI6IjMyODE4ODAifQ%3D%3D",
-            json=rest_targets_page2,
+            json=rest_target_pages[1],
         )
         requests_mock.get(
             f"{REST_URL}/orgs/{REST_ORG}/targets?limit=10&version={REST_VERSION}&excludeEmpty=true&starting_after=v1.eyJpZCI6IjI5MTk1NjgifQ%3D%3D",
-            json=rest_targets_page3,
+            json=rest_target_pages[2],
         )
         t_params = {"limit": 10}
 
@@ -323,6 +382,28 @@ class TestSnykClient(object):
 
         assert len(data) == 30
 
+    def test_get_rest_pages_iter(self, requests_mock, rest_client, rest_target_pages):
+        requests_mock.get(
+            f"{REST_URL}/orgs/{REST_ORG}/targets?limit=10&version={REST_VERSION}",
+            json=rest_target_pages[0],
+        )
+        requests_mock.get(
+            f"{REST_URL}/orgs/{REST_ORG}/targets?limit=10&version={REST_VERSION}&excludeEmpty=true&starting_after=v1.eyJpZCI6IjMyODE4ODAifQ%3D%3D",
+            json=rest_target_pages[1],
+        )
+        requests_mock.get(
+            f"{REST_URL}/orgs/{REST_ORG}/targets?limit=10&version={REST_VERSION}&excludeEmpty=true&starting_after=v1.eyJpZCI6IjI5MTk1NjgifQ%3D%3D",
+            json=rest_target_pages[2],
+        )
+        t_params = {"limit": 10}
+
+        pages = rest_client.get_rest_pages_iter(f"orgs/{REST_ORG}/targets", t_params)
+
+        # No requests are made until the generator is consumed
+        assert requests_mock.call_count == 0
+        assert len(list(pages)) == 30
+        assert requests_mock.call_count == 3
+
     def test_rest_limit_deduplication(self, requests_mock, rest_client):
         requests_mock.get(
             f"{REST_URL}/orgs/{REST_ORG}/projects?limit=100&version={REST_VERSION}"
@@ -397,6 +397,16 @@ class TestProject(TestModels):
         )
         assert project.tags.delete("key", "value")
 
+    def test_add_many_tags(self, project, project_url, requests_mock):
+        requests_mock.post("%s/tags" % project_url, json={})
+        assert project.tags.add_many([("key1", "value1"), ("key2", "value2")])
+        assert requests_mock.call_count == 2
+
+    def test_delete_many_tags(self, project, project_url, requests_mock):
+        requests_mock.post("%s/tags/remove" % project_url, json={})
+        assert project.tags.delete_many([("key1", "value1"), ("key2", "value2")])
+        assert requests_mock.call_count == 2
+
     def test_tags(self, project, project_url, requests_mock):
         assert [] == project.tags.all()
 